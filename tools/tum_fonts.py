@@ -0,0 +1,246 @@
+import html
+import io
+import os
+import re
+import sys
+import urllib.request
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, Script, Stylesheet
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+# Local font directory, next to the existing fonts/ files
+BASE_DIR = Path(os.path.dirname(__file__)).parent
+FONTS_DIR = BASE_DIR / "fonts" / "tum"
+CACHE_DIR = FONTS_DIR / ".cache"
+
+GOOGLE_FONTS_HOST = "fonts.googleapis.com"
+FONTAWESOME_CSS_URL = (
+    "https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.4.0/css/all.min.css"
+)
+FONTAWESOME_WEBFONTS_URL = (
+    "https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.4.0/webfonts/"
+)
+
+# Always keep printable ASCII so text generated at render time (ECharts labels,
+# numbers) still has glyphs
+BASE_CODEPOINTS = set(range(0x20, 0x7F))
+
+LINK_RE = re.compile(r"([ \t]*)(<link\b[^>]*?>)(\n?)", re.S)
+HREF_RE = re.compile(r'href="([^"]+)"')
+FONT_FACE_RE = re.compile(r"@font-face\s*\{([^}]*)\}")
+FA_ICON_RE = re.compile(r"([^{}]+)\{content:\"\\([0-9a-f]+)\"\}")
+FA_SELECTOR_RE = re.compile(r"\.fa-([a-z0-9-]+):{1,2}before")
+FA_WEBFONT_RE = re.compile(r"url\(\.\./webfonts/([\w-]+)\.woff2\)")
+FA_TTF_RE = re.compile(r",\s*url\(\.\./webfonts/[\w-]+\.ttf\)\s*format\(\"truetype\"\)")
+
+
+def fetch(url):
+    """Download url once and return the cached bytes"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    name = re.sub(r"[^\w.-]+", "_", url.split("://", 1)[-1])[-150:]
+    cached = CACHE_DIR / name
+    if not cached.exists():
+        # Python's default user agent makes Google Fonts serve one full TTF per
+        # family and weight, which is what we want to subset
+        with urllib.request.urlopen(url, timeout=30) as response:
+            cached.write_bytes(response.read())
+    return cached.read_bytes()
+
+
+def google_families(href):
+    """Return {family: [weights]} for a Google Fonts css2 URL, or None if unsupported"""
+    families = {}
+    for key, value in parse_qsl(urlsplit(href).query):
+        if key != "family":
+            continue
+        name, _, axes = value.partition(":")
+        if axes and not re.fullmatch(r"wght@\d+(;\d+)*", axes):
+            return None  # italics and other axes are left to the CDN
+        weights = axes[len("wght@") :].split(";") if axes else ["400"]
+        families.setdefault(name, []).extend(weights)
+    return families or None
+
+
+def scan_deck(html_files):
+    """Collect the codepoints, font links and icon names used across a deck"""
+    codepoints = set(BASE_CODEPOINTS)
+    font_links = set()
+    icons = set()
+    for html_file in html_files:
+        source = html_file.read_text(encoding="utf-8")
+        soup = BeautifulSoup(source, "html.parser")
+        # Script and style text is included on purpose: chart labels and CSS
+        # content strings are rendered with the same fonts
+        text = soup.get_text(types=(NavigableString, Script, Stylesheet))
+        codepoints.update(ord(ch) for ch in text if ord(ch) >= 0x20)
+        for tag in soup.find_all(class_=True):
+            icons.update(
+                cls[len("fa-") :] for cls in tag["class"] if cls.startswith("fa-")
+            )
+        for link in soup.find_all("link", href=True):
+            if urlsplit(link["href"]).netloc == GOOGLE_FONTS_HOST:
+                font_links.add(link["href"])
+    return codepoints, font_links, icons
+
+
+def subset_font(font_bytes, codepoints, output_path):
+    """Write a WOFF2 subset of font_bytes containing only codepoints"""
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    font = TTFont(io.BytesIO(font_bytes))
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    font.flavor = "woff2"
+    font.save(output_path)
+    return output_path.stat().st_size
+
+
+def build_google_family(name, query, codepoints):
+    """Subset every weight of one Google Fonts family; return its @font-face rules"""
+    css = fetch(f"https://{GOOGLE_FONTS_HOST}/css2?{query}").decode("utf-8")
+    faces = []
+    for block in FONT_FACE_RE.findall(css):
+        url = re.search(r"url\((\S+?)\)", block).group(1)
+        weight = re.search(r"font-weight:\s*(\d+)", block).group(1)
+        style = re.search(r"font-style:\s*(\w+)", block).group(1)
+        slug = f"{name.lower().replace(' ', '-')}-{weight}"
+        if style != "normal":
+            slug += f"-{style}"
+        output = FONTS_DIR / f"{slug}.woff2"
+        size = subset_font(fetch(url), codepoints, output)
+        print(f"  ✓ {output.name} ({size / 1024:.1f} KB)")
+        faces.append(
+            "@font-face {\n"
+            f"  font-family: '{name}';\n"
+            f"  font-style: {style};\n"
+            f"  font-weight: {weight};\n"
+            "  font-display: block;\n"
+            f"  src: url({output.name}) format('woff2');\n"
+            "}\n"
+        )
+    return faces
+
+
+def build_google_fonts(font_links, codepoints):
+    """Subset every Google Fonts family/weight in the deck; return (css, localized hrefs)"""
+    requested = {}
+    localized = set()
+    for href in font_links:
+        families = google_families(href)
+        if families is None:
+            print(f"  ↷ Keeping remote fonts for {href}")
+            continue
+        for name, weights in families.items():
+            requested.setdefault(name, set()).update(weights)
+        localized.add(href)
+
+    faces = []
+    failed = set()
+    for name, weights in sorted(requested.items()):
+        query = f"family={name.replace(' ', '+')}:wght@{';'.join(sorted(weights))}"
+        try:
+            faces.extend(build_google_family(name, query, codepoints))
+        except Exception as e:
+            print(f"  ✗ Could not localize {name}, keeping it remote: {e}")
+            failed.add(name)
+
+    # A link is only rewritten when every family it loads is available locally
+    localized = {
+        href for href in localized if not failed.intersection(google_families(href))
+    }
+    return "".join(faces), localized
+
+
+def build_fontawesome(icons):
+    """Subset the FontAwesome webfonts to the icons in use; return the local css"""
+    css = fetch(FONTAWESOME_CSS_URL).decode("utf-8")
+
+    codepoints = set()
+    for selectors, codepoint in FA_ICON_RE.findall(css):
+        if icons.intersection(FA_SELECTOR_RE.findall(selectors)):
+            codepoints.add(int(codepoint, 16))
+    print(f"  Found {len(codepoints)} FontAwesome icons in use")
+
+    for webfont in sorted(set(FA_WEBFONT_RE.findall(css))):
+        output = FONTS_DIR / f"{webfont}.woff2"
+        font_bytes = fetch(f"{FONTAWESOME_WEBFONTS_URL}{webfont}.woff2")
+        size = subset_font(font_bytes, codepoints, output)
+        print(f"  ✓ {output.name} ({size / 1024:.1f} KB)")
+
+    css = FA_TTF_RE.sub("", css)
+    return FA_WEBFONT_RE.sub(r"url(\1.woff2)", css)
+
+
+def rewrite_links(source, replacements):
+    """Swap remote font <link> tags for local stylesheets, dropping duplicates"""
+    inserted = set()
+
+    def replace(match):
+        href = HREF_RE.search(match.group(2))
+        local = replacements.get(html.unescape(href.group(1))) if href else None
+        if local is None:
+            return match.group(0)
+        if local in inserted:
+            return ""
+        inserted.add(local)
+        indent, _, newline = match.groups()
+        return f'{indent}<link href="{local}" rel="stylesheet" />{newline}'
+
+    return LINK_RE.sub(replace, source)
+
+
+def localize_fonts(html_files, output_dir):
+    """Subset the fonts used across a deck and write slide copies that load them locally"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    codepoints, font_links, icons = scan_deck(html_files)
+    print(f"Subsetting fonts to {len(codepoints)} glyphs used across the deck...")
+
+    google_css, localized = build_google_fonts(font_links, codepoints)
+    fonts_css = FONTS_DIR / "fonts.css"
+    fonts_css.write_text(google_css, encoding="utf-8")
+
+    replacements = {href: fonts_css for href in localized}
+
+    fontawesome_css = FONTS_DIR / "fontawesome.css"
+    try:
+        fontawesome_css.write_text(build_fontawesome(icons), encoding="utf-8")
+        replacements[FONTAWESOME_CSS_URL] = fontawesome_css
+    except Exception as e:
+        print(f"  ✗ Could not localize FontAwesome, keeping it remote: {e}")
+
+    relative = {
+        href: Path(os.path.relpath(path, output_dir)).as_posix()
+        for href, path in replacements.items()
+    }
+
+    staged = []
+    for html_file in html_files:
+        source = html_file.read_text(encoding="utf-8")
+        staged_file = output_dir / html_file.name
+        staged_file.write_text(rewrite_links(source, relative), encoding="utf-8")
+        staged.append(staged_file)
+
+    print(f"✓ Wrote {len(staged)} slides with local fonts to {output_dir}")
+    return staged
+
+
+if __name__ == "__main__":
+    # Usage: python tools/tum_fonts.py [deck_dir] [output_dir]
+    deck_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else BASE_DIR / "TUM"
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else deck_dir / "build"
+    pages = sorted(
+        [f for f in deck_dir.iterdir() if f.suffix == ".html" and f.name.startswith("page")],
+        key=lambda x: int(x.stem.replace("page", "")),
+    )
+    localize_fonts(pages, output_dir)
@@ -0,0 +1,159 @@
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+BASE_DIR = Path(os.path.dirname(__file__)).parent
+
+# Same KaTeX build the slides load; katex.min.css stays in the pages for
+# styling and fonts, only the JavaScript is dropped
+KATEX_JS_URL = "https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js"
+
+# Matches auto-render's delimiters ($$ before $) and skips the tags it ignores.
+# Math never spans tags, so expressions stop at the next "<"
+MATH_RE = re.compile(
+    r"(<(script|style|textarea|pre|code|option|noscript)\b.*?</\2\s*>|<[^>]+>)"
+    r"|\$\$([^<]+?)\$\$"
+    r"|\$([^<$]+?)\$",
+    re.S | re.I,
+)
+KATEX_SCRIPT_RE = re.compile(
+    r"[ \t]*<script\b[^>]*?katex[^>]*>\s*</script>\n?", re.S
+)
+AUTO_RENDER_INIT_RE = re.compile(
+    r"[ \t]*<script>(?:(?!</script>).)*?renderMathInElement(?:(?!</script>).)*</script>\n?",
+    re.S,
+)
+
+
+def cache_key(expression, display):
+    """Cache key for an expression in the given display mode and KaTeX build"""
+    mode = "display" if display else "inline"
+    key = f"{KATEX_JS_URL}:{mode}:{expression}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def find_math(source):
+    """Yield (expression, display) for every delimited formula outside skipped tags"""
+    for match in MATH_RE.finditer(source):
+        if match.group(1):
+            continue
+        display = match.group(3) is not None
+        expression = match.group(3) if display else match.group(4)
+        yield html.unescape(expression).strip(), display
+
+
+def replace_math(source, rendered):
+    """Replace every delimited formula with its pre-rendered KaTeX markup"""
+
+    def replace(match):
+        if match.group(1):
+            return match.group(0)
+        display = match.group(3) is not None
+        expression = match.group(3) if display else match.group(4)
+        return rendered[cache_key(html.unescape(expression).strip(), display)]
+
+    return MATH_RE.sub(replace, source)
+
+
+def typeset(expressions, driver):
+    """Render all (expression, display) pairs with KaTeX in one browser call"""
+    driver.get("about:blank")
+    driver.set_script_timeout(30)
+    loaded = driver.execute_async_script(
+        """
+        const done = arguments[arguments.length - 1];
+        const script = document.createElement("script");
+        script.src = arguments[0];
+        script.onload = () => done(true);
+        script.onerror = () => done(false);
+        document.head.appendChild(script);
+        """,
+        KATEX_JS_URL,
+    )
+    if not loaded:
+        raise RuntimeError(f"Could not load KaTeX from {KATEX_JS_URL}")
+
+    return driver.execute_script(
+        """
+        return arguments[0].map(([expression, display]) =>
+          katex.renderToString(expression, {
+            displayMode: display,
+            throwOnError: false,
+          })
+        );
+        """,
+        [[expression, display] for expression, display in expressions],
+    )
+
+
+def prerender_math(html_files, driver, cache_path):
+    """Replace KaTeX auto-render in html_files with static markup, in place"""
+    cache_path = Path(cache_path)
+    cache = {}
+    if cache_path.exists():
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+
+    pages = {}
+    pending = {}
+    for html_file in html_files:
+        source = html_file.read_text(encoding="utf-8")
+        if "renderMathInElement" not in source:
+            continue
+        pages[html_file] = source
+        for expression, display in find_math(source):
+            key = cache_key(expression, display)
+            if key not in cache:
+                pending[key] = (expression, display)
+
+    if not pages:
+        return
+
+    print(
+        f"Pre-rendering math in {len(pages)} pages "
+        f"({len(pending)} new expressions, {len(cache)} cached)..."
+    )
+    if pending:
+        try:
+            results = typeset(list(pending.values()), driver)
+            cache.update(zip(pending.keys(), results))
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+        except Exception as e:
+            print(f"✗ Error pre-rendering math, keeping KaTeX auto-render: {e}")
+
+    for html_file, source in pages.items():
+        if any(cache_key(*math) not in cache for math in find_math(source)):
+            print(f"  ↷ {html_file.name} (left to auto-render)")
+            continue
+        source = replace_math(source, cache)
+        source = KATEX_SCRIPT_RE.sub("", source)
+        source = AUTO_RENDER_INIT_RE.sub("", source)
+        html_file.write_text(source, encoding="utf-8")
+        print(f"  ✓ {html_file.name}")
+
+
+if __name__ == "__main__":
+    # Usage: python tools/tum_katex.py page.html [page.html ...]
+    # Rewrites the given pages in place, so run it on staged copies
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    driver = webdriver.Chrome(options=chrome_options)
+    try:
+        prerender_math(
+            [Path(arg) for arg in sys.argv[1:]],
+            driver,
+            BASE_DIR / "TUM" / "build" / "katex-cache.json",
+        )
+    finally:
+        driver.quit()
@@ -9,12 +9,15 @@ from pathlib import Path
 import time
 import base64
 import subprocess
+from tum_fonts import localize_fonts
+from tum_katex import prerender_math
 
 # Directory containing HTML files
 BASE_DIR = Path(os.path.dirname(__file__)).parent
 TUM_DIR = BASE_DIR / "TUM"
 OUTPUT_DIR = TUM_DIR / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
+BUILD_DIR = TUM_DIR / "build"
 
 # Find all page HTML files in TUM directory and sort them numerically
 html_files = sorted(
@@ -24,6 +27,9 @@ html_files = sorted(
 
 print(f"Found {len(html_files)} HTML pages in TUM folder")
 
+# Render staged copies that load deck-wide subsetted fonts from fonts/tum/
+html_files = localize_fonts(html_files, BUILD_DIR)
+
 # Set up headless Chrome
 chrome_options = Options()
 chrome_options.add_argument("--headless=new")
@@ -36,6 +42,9 @@ chrome_options.add_argument("--force-device-scale-factor=1")
 driver = webdriver.Chrome(options=chrome_options)
 driver.set_window_size(1280, 720)
 
+# Typeset all formulas in one batch so pages no longer run KaTeX when rendered
+prerender_math(html_files, driver, BUILD_DIR / "katex-cache.json")
+
 # Store all PDF file paths
 pdf_pages = []
 
@@ -43,8 +52,12 @@ for html_file in html_files:
     file_url = f"file://{html_file.resolve()}"
     driver.get(file_url)
 
-    # Wait for rendering and KaTeX if present
-    time.sleep(1.5)  # Increased wait time for KaTeX rendering
+    # Wait for rendering; ECharts animations and runtime KaTeX need longer
+    source = html_file.read_text(encoding="utf-8")
+    if "echarts" in source or "renderMathInElement" in source:
+        time.sleep(1.5)
+    else:
+        time.sleep(0.3)
 
     try:
         # Wait for slide container to load